@@ -9,10 +9,16 @@ para compressão de 40-60%.
 __version__ = "2.0.0"
 __author__ = "CompactPDF Team"
 
+import importlib
+
 from .core.facade import PDFCompressor
 from .core.models import CompressionResult, CompressionConfig, CompressionLevel
-from .strategies.pymupdf_strategy import PyMuPDFStrategy
-from .strategies.spire_strategy import SpireStrategy
+
+# Estratégias carregadas sob demanda (importam PyMuPDF/Spire.PDF)
+_LAZY_STRATEGIES = {
+    'PyMuPDFStrategy': '.strategies.pymupdf_strategy',
+    'SpireStrategy': '.strategies.spire_strategy',
+}
 
 __all__ = [
     'PDFCompressor',
@@ -22,3 +28,13 @@ __all__ = [
     'PyMuPDFStrategy',
     'SpireStrategy'
 ]
+
+
+def __getattr__(name):
+    """Importa as estratégias apenas no primeiro acesso."""
+    module_name = _LAZY_STRATEGIES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -30,6 +30,7 @@ class PDFCompressor:
         # Lazy loading das estratégias
         self._pymupdf_strategy = None
         self._spire_strategy = None
+        self._available_methods = None
         
         # Configurar logging
         logging.basicConfig(level=logging.INFO)
@@ -76,14 +77,7 @@ class PDFCompressor:
         # Converter para Path
         input_path = Path(input_path)
         
-        # Validar entrada
-        if not input_path.exists():
-            return create_error_result(
-                str(input_path), 
-                str(output_path or ""), 
-                f"Arquivo não encontrado: {input_path}"
-            )
-        
+        # Validar entrada (extensão primeiro: não acessa o disco)
         if not input_path.suffix.lower() == '.pdf':
             return create_error_result(
                 str(input_path),
@@ -91,6 +85,13 @@ class PDFCompressor:
                 "Arquivo deve ter extensão .pdf"
             )
         
+        if not input_path.exists():
+            return create_error_result(
+                str(input_path), 
+                str(output_path or ""), 
+                f"Arquivo não encontrado: {input_path}"
+            )
+        
         # Configurar saída
         if output_path is None:
             output_path = input_path.parent / f"{input_path.stem}_compressed.pdf"
@@ -102,7 +103,7 @@ class PDFCompressor:
             config = CompressionConfig()
         
         # Tentar compressão
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Escolher estratégia
@@ -116,12 +117,12 @@ class PDFCompressor:
             
             # Adicionar tempo de processamento
             if result.success:
-                result.processing_time = time.time() - start_time
+                result.processing_time = time.monotonic() - start_time
             
             return result
             
         except Exception as e:
-            logger.error(f"Erro na compressão: {e}")
+            logger.error("Erro na compressão: %s", e)
             return create_error_result(
                 str(input_path),
                 str(output_path),
@@ -185,15 +186,20 @@ class PDFCompressor:
     
     def get_available_methods(self) -> list[str]:
         """Retorna lista de métodos disponíveis."""
-        methods = []
-        strategy = self.pymupdf_strategy
-        if strategy and strategy.is_available():
-            methods.append("pymupdf")
-        strategy = self.spire_strategy
-        if strategy and strategy.is_available():
-            methods.append("spire")
-        return methods
+        # Disponibilidade é fixa após o import das bibliotecas
+        if self._available_methods is None:
+            methods = []
+            strategy = self.pymupdf_strategy
+            if strategy and strategy.is_available():
+                methods.append("pymupdf")
+            strategy = self.spire_strategy
+            if strategy and strategy.is_available():
+                methods.append("spire")
+            self._available_methods = tuple(methods)
+        return list(self._available_methods)
     
     def is_ready(self) -> bool:
         """Verifica se pelo menos um método está disponível."""
-        return len(self.get_available_methods()) > 0
+        if self._available_methods is None:
+            self.get_available_methods()
+        return len(self._available_methods) > 0
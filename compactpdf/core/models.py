@@ -40,7 +40,8 @@ class CompressionResult:
     @property
     def size_saved(self) -> int:
         """Calcula o espaço economizado em bytes."""
-        return max(0, self.original_size - self.compressed_size)
+        saved = self.original_size - self.compressed_size
+        return saved if saved > 0 else 0
 
 
 @dataclass
@@ -5,10 +5,10 @@ CompactPDF - Estratégia PyMuPDF
 Estratégia de compressão usando PyMuPDF para atingir 40-60% de redução.
 """
 
+import os
 import time
 import logging
 from typing import Optional
-from pathlib import Path
 
 try:
     import fitz  # PyMuPDF
@@ -22,6 +22,9 @@ from ..core.models import CompressionResult, CompressionConfig, CompressionLevel
 
 logger = logging.getLogger(__name__)
 
+# Maior dimensão (px) mantida pela compressão agressiva
+MAX_IMAGE_DIMENSION = 1200
+
 
 class PyMuPDFStrategy:
     """
@@ -66,11 +69,11 @@ class PyMuPDFStrategy:
         if config is None:
             config = CompressionConfig()
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Obter tamanho original
-            original_size = Path(input_path).stat().st_size
+            original_size = os.path.getsize(input_path)
             
             # Abrir documento
             doc = fitz.open(input_path)
@@ -95,10 +98,15 @@ class PyMuPDFStrategy:
             doc.close()
             
             # Verificar resultado
-            compressed_size = Path(output_path).stat().st_size
-            processing_time = time.time() - start_time
+            compressed_size = os.path.getsize(output_path)
+            processing_time = time.monotonic() - start_time
             
-            logger.info(f"PyMuPDF: {original_size} → {compressed_size} bytes ({processing_time:.2f}s)")
+            logger.info(
+                "PyMuPDF: %d → %d bytes (%.2fs)",
+                original_size,
+                compressed_size,
+                processing_time
+            )
             
             return create_success_result(
                 input_path,
@@ -110,7 +118,7 @@ class PyMuPDFStrategy:
             )
             
         except Exception as e:
-            logger.error(f"Erro na compressão PyMuPDF: {e}")
+            logger.error("Erro na compressão PyMuPDF: %s", e)
             return create_error_result(
                 input_path,
                 output_path,
@@ -118,52 +126,95 @@ class PyMuPDFStrategy:
                 method_used="PyMuPDF"
             )
     
+    def _can_recompress(self, doc, img):
+        """Verifica se a imagem pode virar JPEG sem perder transparência."""
+        xref, smask, bpc = img[0], img[1], img[4]
+        # Máscara suave ou estêncil de 1 bit: o JPEG descartaria a máscara
+        if smask != 0 or bpc == 1:
+            return False
+        # /ImageMask, /Mask e /Decode não sobrevivem à substituição
+        for key in ("ImageMask", "Mask", "Decode"):
+            if doc.xref_get_key(xref, key)[0] != "null":
+                return False
+        return True
+    
+    def _replace_image(self, doc, page, xref, pixmap, quality):
+        """Substitui a imagem do xref por uma versão JPEG, se ficar menor."""
+        if pixmap.alpha:
+            return False
+        data = pixmap.tobytes("jpeg", jpg_quality=quality)
+        if len(data) >= len(doc.xref_stream_raw(xref)):
+            return False
+        page.replace_image(xref, stream=data)
+        return True
+    
     def _apply_light_compression(self, doc):
         """Aplica compressão leve (preserva qualidade)."""
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            
+        # A substituição vale para o xref (todas as páginas que o usam),
+        # então imagens compartilhadas são processadas uma vez
+        processed_xrefs = set()
+        for page in doc:
             # Compressão básica de imagens
             image_list = page.get_images()
-            for img_index, img in enumerate(image_list):
+            for img in image_list:
+                xref = img[0]
+                if xref in processed_xrefs:
+                    continue
+                processed_xrefs.add(xref)
                 try:
-                    xref = img[0]
+                    if not self._can_recompress(doc, img):
+                        continue
                     base_image = doc.extract_image(xref)
                     
                     # Recomprimir apenas se necessário
                     if base_image["ext"] in ["png", "tiff"]:
                         # Converter para JPEG com alta qualidade
-                        page._insert_image_from_pixmap(
+                        self._replace_image(
+                            doc,
+                            page,
+                            xref,
                             fitz.Pixmap(base_image["image"]),
-                            quality=85
+                            85
                         )
                 except Exception:
                     continue
     
     def _apply_medium_compression(self, doc):
         """Aplica compressão média (balanceada)."""
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            
+        # A substituição vale para o xref (todas as páginas que o usam),
+        # então imagens compartilhadas são processadas uma vez
+        processed_xrefs = set()
+        for page in doc:
             # Compressão de imagens
             image_list = page.get_images()
-            for img_index, img in enumerate(image_list):
+            for img in image_list:
+                xref = img[0]
+                if xref in processed_xrefs:
+                    continue
+                processed_xrefs.add(xref)
                 try:
-                    xref = img[0]
+                    if not self._can_recompress(doc, img):
+                        continue
                     base_image = doc.extract_image(xref)
                     
                     # Recomprimir com qualidade média
                     if base_image["width"] * base_image["height"] > 100000:  # Imagens grandes
                         # Reduzir qualidade para imagens grandes
-                        page._insert_image_from_pixmap(
+                        self._replace_image(
+                            doc,
+                            page,
+                            xref,
                             fitz.Pixmap(base_image["image"]),
-                            quality=70
+                            70
                         )
                     else:
                         # Manter qualidade para imagens pequenas
-                        page._insert_image_from_pixmap(
+                        self._replace_image(
+                            doc,
+                            page,
+                            xref,
                             fitz.Pixmap(base_image["image"]),
-                            quality=80
+                            80
                         )
                 except Exception:
                     continue
@@ -173,35 +224,55 @@ class PyMuPDFStrategy:
     
     def _apply_aggressive_compression(self, doc):
         """Aplica compressão agressiva (máxima redução)."""
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            
+        # A substituição vale para o xref (todas as páginas que o usam),
+        # então imagens compartilhadas são processadas uma vez
+        processed_xrefs = set()
+        for page in doc:
             # Compressão agressiva de imagens
             image_list = page.get_images()
-            for img_index, img in enumerate(image_list):
+            for img in image_list:
+                xref = img[0]
+                if xref in processed_xrefs:
+                    continue
+                processed_xrefs.add(xref)
                 try:
-                    xref = img[0]
+                    if not self._can_recompress(doc, img):
+                        continue
                     base_image = doc.extract_image(xref)
                     
                     # Reduzir qualidade drasticamente
                     pixmap = fitz.Pixmap(base_image["image"])
                     
                     # Redimensionar se muito grande
-                    if pixmap.width > 1200 or pixmap.height > 1200:
-                        # Reduzir resolução
-                        scale = min(1200/pixmap.width, 1200/pixmap.height)
-                        mat = fitz.Matrix(scale, scale)
-                        pixmap = pixmap.transform(mat)
+                    width, height = pixmap.width, pixmap.height
+                    if width > height:
+                        longest, shortest = width, height
+                    else:
+                        longest, shortest = height, width
+                    if longest > MAX_IMAGE_DIMENSION:
+                        # Reduções de 4x ou mais: shrink (média de blocos 2^n)
+                        # antes do ajuste fino, que fica entre 2x e 4x.
+                        # Limitado para o lado menor não chegar a 0 px
+                        factor = (longest // (MAX_IMAGE_DIMENSION * 2)).bit_length() - 1
+                        factor = min(factor, shortest.bit_length() - 1)
+                        if factor > 0:
+                            pixmap.shrink(factor)
+                            width, height = pixmap.width, pixmap.height
+                            longest = width if width > height else height
+                        
+                        # Reduzir resolução (cópia escalada)
+                        scale = MAX_IMAGE_DIMENSION / longest
+                        pixmap = fitz.Pixmap(
+                            pixmap,
+                            max(1, int(width * scale)),
+                            max(1, int(height * scale))
+                        )
                     
                     # Recomprimir com baixa qualidade
-                    page._insert_image_from_pixmap(pixmap, quality=50)
+                    self._replace_image(doc, page, xref, pixmap, 50)
                     
                 except Exception:
                     continue
             
             # Limpeza agressiva
             page.clean_contents()
-            
-            # Remover metadados da página
-            if hasattr(page, 'set_metadata'):
-                page.set_metadata({})
@@ -5,10 +5,10 @@ CompactPDF - Estratégia Spire.PDF
 Estratégia de compressão usando Spire.PDF para atingir 40-60% de redução.
 """
 
+import os
 import time
 import logging
 from typing import Optional
-from pathlib import Path
 
 try:
     from spire.pdf import PdfDocument, PdfImageHelper
@@ -23,6 +23,9 @@ from ..core.models import CompressionResult, CompressionConfig, CompressionLevel
 
 logger = logging.getLogger(__name__)
 
+# Maior dimensão (px) mantida pela compressão agressiva
+MAX_IMAGE_DIMENSION = 1200
+
 
 class SpireStrategy:
     """
@@ -67,11 +70,11 @@ class SpireStrategy:
         if config is None:
             config = CompressionConfig()
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Obter tamanho original
-            original_size = Path(input_path).stat().st_size
+            original_size = os.path.getsize(input_path)
             
             # Carregar documento
             doc = PdfDocument()
@@ -90,10 +93,15 @@ class SpireStrategy:
             doc.Close()
             
             # Verificar resultado
-            compressed_size = Path(output_path).stat().st_size
-            processing_time = time.time() - start_time
+            compressed_size = os.path.getsize(output_path)
+            processing_time = time.monotonic() - start_time
             
-            logger.info(f"Spire.PDF: {original_size} → {compressed_size} bytes ({processing_time:.2f}s)")
+            logger.info(
+                "Spire.PDF: %d → %d bytes (%.2fs)",
+                original_size,
+                compressed_size,
+                processing_time
+            )
             
             return create_success_result(
                 input_path,
@@ -105,7 +113,7 @@ class SpireStrategy:
             )
             
         except Exception as e:
-            logger.error(f"Erro na compressão Spire.PDF: {e}")
+            logger.error("Erro na compressão Spire.PDF: %s", e)
             return create_error_result(
                 input_path,
                 output_path,
@@ -117,19 +125,21 @@ class SpireStrategy:
         """Aplica compressão leve (preserva qualidade)."""
         try:
             # Compressão básica de imagens
-            for page_index in range(doc.Pages.Count):
-                page = doc.Pages[page_index]
+            pages = doc.Pages
+            for page_index in range(pages.Count):
+                page = pages[page_index]
                 
                 # Otimizar imagens com alta qualidade
-                if hasattr(page, 'ExtractImages'):
-                    images = page.ExtractImages()
-                    for img in images:
+                extract_images = getattr(page, 'ExtractImages', None)
+                if extract_images is not None:
+                    for img in extract_images():
                         # Recomprimir com qualidade alta (85%)
-                        if hasattr(img, 'CompressImage'):
-                            img.CompressImage(85)
+                        compress_image = getattr(img, 'CompressImage', None)
+                        if compress_image is not None:
+                            compress_image(85)
                         
         except Exception as e:
-            logger.warning(f"Erro na compressão leve Spire.PDF: {e}")
+            logger.warning("Erro na compressão leve Spire.PDF: %s", e)
     
     def _apply_medium_compression(self, doc):
         """Aplica compressão média (balanceada)."""
@@ -139,23 +149,26 @@ class SpireStrategy:
                 doc.CompressionLevel = 6  # Nível médio
             
             # Otimizar cada página
-            for page_index in range(doc.Pages.Count):
-                page = doc.Pages[page_index]
+            pages = doc.Pages
+            for page_index in range(pages.Count):
+                page = pages[page_index]
                 
                 # Compressão de imagens com qualidade média
-                if hasattr(page, 'ExtractImages'):
-                    images = page.ExtractImages()
-                    for img in images:
+                extract_images = getattr(page, 'ExtractImages', None)
+                if extract_images is not None:
+                    for img in extract_images():
                         # Recomprimir com qualidade média (70%)
-                        if hasattr(img, 'CompressImage'):
-                            img.CompressImage(70)
+                        compress_image = getattr(img, 'CompressImage', None)
+                        if compress_image is not None:
+                            compress_image(70)
                 
                 # Otimizar conteúdo da página
-                if hasattr(page, 'OptimizeContent'):
-                    page.OptimizeContent()
+                optimize_content = getattr(page, 'OptimizeContent', None)
+                if optimize_content is not None:
+                    optimize_content()
                         
         except Exception as e:
-            logger.warning(f"Erro na compressão média Spire.PDF: {e}")
+            logger.warning("Erro na compressão média Spire.PDF: %s", e)
     
     def _apply_aggressive_compression(self, doc):
         """Aplica compressão agressiva (máxima redução)."""
@@ -165,38 +178,47 @@ class SpireStrategy:
                 doc.CompressionLevel = 9  # Nível máximo
             
             # Otimizar cada página agressivamente
-            for page_index in range(doc.Pages.Count):
-                page = doc.Pages[page_index]
+            pages = doc.Pages
+            for page_index in range(pages.Count):
+                page = pages[page_index]
                 
                 # Compressão agressiva de imagens
-                if hasattr(page, 'ExtractImages'):
-                    images = page.ExtractImages()
-                    for img in images:
+                extract_images = getattr(page, 'ExtractImages', None)
+                if extract_images is not None:
+                    for img in extract_images():
                         # Recomprimir com baixa qualidade (50%)
-                        if hasattr(img, 'CompressImage'):
-                            img.CompressImage(50)
+                        compress_image = getattr(img, 'CompressImage', None)
+                        if compress_image is not None:
+                            compress_image(50)
                         
                         # Reduzir resolução se possível
-                        if hasattr(img, 'ResizeImage'):
+                        resize_image = getattr(img, 'ResizeImage', None)
+                        if resize_image is not None:
                             # Reduzir para máximo 1200px
-                            if hasattr(img, 'Width') and hasattr(img, 'Height'):
-                                if img.Width > 1200 or img.Height > 1200:
-                                    scale = min(1200/img.Width, 1200/img.Height)
-                                    new_width = int(img.Width * scale)
-                                    new_height = int(img.Height * scale)
-                                    img.ResizeImage(new_width, new_height)
+                            width = getattr(img, 'Width', None)
+                            height = getattr(img, 'Height', None)
+                            if width is not None and height is not None:
+                                longest = width if width > height else height
+                                if longest > MAX_IMAGE_DIMENSION:
+                                    scale = MAX_IMAGE_DIMENSION / longest
+                                    new_width = int(width * scale)
+                                    new_height = int(height * scale)
+                                    resize_image(new_width, new_height)
                 
                 # Otimizar conteúdo da página
-                if hasattr(page, 'OptimizeContent'):
-                    page.OptimizeContent()
+                optimize_content = getattr(page, 'OptimizeContent', None)
+                if optimize_content is not None:
+                    optimize_content()
                 
                 # Remover elementos desnecessários
-                if hasattr(page, 'RemoveUnusedResources'):
-                    page.RemoveUnusedResources()
+                remove_unused = getattr(page, 'RemoveUnusedResources', None)
+                if remove_unused is not None:
+                    remove_unused()
             
             # Otimizar documento inteiro
-            if hasattr(doc, 'OptimizeDocument'):
-                doc.OptimizeDocument()
+            optimize_document = getattr(doc, 'OptimizeDocument', None)
+            if optimize_document is not None:
+                optimize_document()
                         
         except Exception as e:
-            logger.warning(f"Erro na compressão agressiva Spire.PDF: {e}")
+            logger.warning("Erro na compressão agressiva Spire.PDF: %s", e)
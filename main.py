@@ -55,16 +55,16 @@ def main():
             return 1
         return 0
     
-    # Verificar entrada
+    # Verificar entrada (extensão primeiro: não acessa o disco)
     input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"Erro: Arquivo '{input_path}' não encontrado")
-        return 1
-    
     if not input_path.suffix.lower() == '.pdf':
         print("Erro: Arquivo deve ser um PDF")
         return 1
     
+    if not input_path.exists():
+        print(f"Erro: Arquivo '{input_path}' não encontrado")
+        return 1
+    
     # Configurar saída
     if args.output:
         output_path = Path(args.output)